@@ -86,32 +86,14 @@ def read_api_keys(f) -> list:
 def cli_import(options):
     keys = read_api_keys(options.api_keys_file)
 
-    configs = []
+    cfg = {"devices": {}, "folders": {}}
+
     for endpoint in options.endpoints:
         logging.info(f"Checking { endpoint }")
         ep = EndPoint(keys, endpoint)
         ep.ping()
-        configs.append({"id": ep.status()["myID"], "config": ep.get_config()})
-
-    cfg = {"devices": {}, "folders": {}}
-
-    for config in configs:
-        for device in config["config"]["devices"]:
-            did = device["deviceID"]
-            if did not in cfg["devices"]:
-                cfg["devices"][did] = {"name": collections.Counter()}
-            cfg["devices"][did]["name"][device["name"]] += 1
-
-        for folder in config["config"]["folders"]:
-            fid = folder["id"]
-            if fid not in cfg["folders"]:
-                cfg["folders"][fid] = {
-                    "label": collections.Counter(),
-                    "devices": collections.Counter()
-                }
-            cfg["folders"][fid]["label"][folder["label"]] += 1
-            for device in folder["devices"]:
-                cfg["folders"][fid]["devices"][device["deviceID"]] += 1
+        # fold in each config as it arrives so only one is held at a time
+        fold_config(cfg, ep.get_config())
 
     cfg = gen_config(cfg)
 
@@ -119,7 +101,28 @@ def cli_import(options):
         base = json.load(options.base_config)
         cfg = merge_config(base, cfg)
 
-    print(json.dumps(cfg, sort_keys=True, indent=4))
+    # json.dump writes incrementally rather than building one big string
+    json.dump(cfg, sys.stdout, sort_keys=True, indent=4)
+    sys.stdout.write("\n")
+
+
+def fold_config(cfg, config):
+    for device in config["devices"]:
+        did = device["deviceID"]
+        if did not in cfg["devices"]:
+            cfg["devices"][did] = {"name": collections.Counter()}
+        cfg["devices"][did]["name"][device["name"]] += 1
+
+    for folder in config["folders"]:
+        fid = folder["id"]
+        if fid not in cfg["folders"]:
+            cfg["folders"][fid] = {
+                "label": collections.Counter(),
+                "devices": collections.Counter()
+            }
+        cfg["folders"][fid]["label"][folder["label"]] += 1
+        for device in folder["devices"]:
+            cfg["folders"][fid]["devices"][device["deviceID"]] += 1
 
 
 def gen_config(cfg):
@@ -536,7 +539,8 @@ def cli_restore(options):
         sys.exit(
             f"""Device id is { id }\nNot restoring because that id needs to be in filename"""
         )
-    config = json.load(open(options.config, "rt"))
+    with open(options.config, "rt") as f:
+        config = json.load(f)
     make_backup(options, ep)
     ep.update_config(config)
 